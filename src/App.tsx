@@ -1,35 +1,8 @@
 import { useState, useCallback, useMemo } from 'react'
 import Plot from 'react-plotly.js'
-import FFT from 'fft.js'
 import './App.css'
 import { createParser, CSVMetadata, DataPoint } from './parsers'
-
-interface MetricDataPoint {
-  time: number
-  absoluteTime: Date
-  rms_x?: number
-  rms_y?: number
-  rms_z?: number
-  rms_total?: number
-  percentile_90?: number
-  band_0_1?: number
-  band_1_5?: number
-  band_5_10?: number
-  band_10_20?: number
-  band_20_30?: number
-  band_30_40?: number
-  band_40_50?: number
-  band_50_60?: number
-  band_60_70?: number
-  band_70_80?: number
-  band_80_90?: number
-  band_90_100?: number
-}
-
-type MetricType = 'rms_x' | 'rms_y' | 'rms_z' | 'rms_total' | 'percentile_90' | 
-  'band_0_1' | 'band_1_5' | 'band_5_10' | 'band_10_20' | 'band_20_30' | 
-  'band_30_40' | 'band_40_50' | 'band_50_60' | 'band_60_70' | 'band_70_80' | 
-  'band_80_90' | 'band_90_100'
+import { calculateWindowMetrics, MetricDataPoint, MetricType } from './metrics'
 
 interface ActualSampleRateInfo {
   actualSampleRate: number
@@ -60,67 +33,6 @@ function App() {
   const [snapToNow, setSnapToNow] = useState<boolean>(true)
   const [selectedMetrics, setSelectedMetrics] = useState<Set<MetricType>>(new Set(['rms_z', 'rms_total']))
 
-  // Calculate RMS for a given axis
-  const calculateAxisRMS = (window: DataPoint[], axis: 'ax' | 'ay' | 'az'): number => {
-    const sumSquares = window.reduce((sum, point) => sum + point[axis] * point[axis], 0)
-    return Math.sqrt(sumSquares / window.length)
-  }
-
-  // Calculate total acceleration magnitude for each point
-  const calculateTotalAcceleration = (point: DataPoint): number => {
-    return Math.sqrt(point.ax * point.ax + point.ay * point.ay + point.az * point.az)
-  }
-
-  // Calculate 90th percentile
-  const calculate90thPercentile = (window: DataPoint[]): number => {
-    const totals = window.map(calculateTotalAcceleration).sort((a, b) => a - b)
-    const index = Math.floor(totals.length * 0.9)
-    return totals[index]
-  }
-
-  // Calculate RMS in frequency bands using FFT
-  const calculateFrequencyBandRMS = (window: DataPoint[], sampleRate: number, minFreq: number, maxFreq: number): number => {
-    if (window.length === 0 || sampleRate === 0) return 0
-
-    // Calculate total acceleration for each sample
-    const signal = window.map(calculateTotalAcceleration)
-    
-    // Pad to next power of 2 for FFT
-    const fftSize = Math.pow(2, Math.ceil(Math.log2(signal.length)))
-    const fft = new FFT(fftSize)
-    
-    // Pad signal with zeros
-    const paddedSignal = new Array(fftSize).fill(0)
-    for (let i = 0; i < signal.length; i++) {
-      paddedSignal[i] = signal[i]
-    }
-    
-    // Compute FFT
-    const out = fft.createComplexArray()
-    fft.realTransform(out, paddedSignal)
-    
-    // Calculate frequency resolution
-    const freqResolution = sampleRate / fftSize
-    
-    // Sum power in the frequency band
-    let sumPower = 0
-    let count = 0
-    
-    for (let i = 0; i < fftSize / 2; i++) {
-      const freq = i * freqResolution
-      if (freq >= minFreq && freq < maxFreq) {
-        const real = out[2 * i]
-        const imag = out[2 * i + 1]
-        sumPower += real * real + imag * imag
-        count++
-      }
-    }
-    
-    // Return RMS in the band
-    return count > 0 ? Math.sqrt(sumPower / count) : 0
-  }
-
-
   const parseFile = useCallback(async (file: File) => {
     try {
       setError('')
@@ -176,11 +88,15 @@ function App() {
       })
     }
     
-    // Normalize all times to be relative to the first point (start at 0)
-    const normalizedData: DataPoint[] = dataPoints.map(point => ({
-      ...point,
-      time: point.time - firstPoint.time
-    }))
+    // Normalize all times to be relative to the first point (start at 0).
+    // Files whose first timestamp is exactly 0 need no shift, so the parsed
+    // array is returned as is and the data state aliases the parser's output
+    const normalizedData: DataPoint[] = firstPoint.time === 0
+      ? dataPoints
+      : dataPoints.map(point => ({
+          ...point,
+          time: point.time - firstPoint.time
+        }))
     
     console.log('Sample rate calculation:', {
       dataPoints: dataPoints.length,
@@ -238,83 +154,13 @@ function App() {
     const overlapSamples = Math.floor(windowSizeSamples * (overlapPct / 100))
     const stepSize = Math.max(1, windowSizeSamples - overlapSamples)
     
-    const results: MetricDataPoint[] = []
-    
-    // Process data in overlapping windows
-    for (let i = 0; i < dataPoints.length; i += stepSize) {
-      const windowEnd = Math.min(i + windowSizeSamples, dataPoints.length)
-      const window = dataPoints.slice(i, windowEnd)
-      
-      if (window.length === 0) break
-      
-      // Use the maximum timestamp in the window
-      const maxTimeInWindow = window[window.length - 1].time
-      const absoluteTime = new Date(startTime.getTime() + maxTimeInWindow * 1000)
-      
-      const point: MetricDataPoint = {
-        time: maxTimeInWindow,
-        absoluteTime,
-      }
-      
-      // Calculate all metrics
-      if (selectedMetrics.has('rms_x')) {
-        point.rms_x = calculateAxisRMS(window, 'ax')
-      }
-      if (selectedMetrics.has('rms_y')) {
-        point.rms_y = calculateAxisRMS(window, 'ay')
-      }
-      if (selectedMetrics.has('rms_z')) {
-        point.rms_z = calculateAxisRMS(window, 'az')
-      }
-      if (selectedMetrics.has('rms_total')) {
-        const totals = window.map(calculateTotalAcceleration)
-        const sumSquares = totals.reduce((sum, val) => sum + val * val, 0)
-        point.rms_total = Math.sqrt(sumSquares / totals.length)
-      }
-      if (selectedMetrics.has('percentile_90')) {
-        point.percentile_90 = calculate90thPercentile(window)
-      }
-      
-      // Frequency bands
-      if (selectedMetrics.has('band_0_1')) {
-        point.band_0_1 = calculateFrequencyBandRMS(window, sampleRate, 0, 1)
-      }
-      if (selectedMetrics.has('band_1_5')) {
-        point.band_1_5 = calculateFrequencyBandRMS(window, sampleRate, 1, 5)
-      }
-      if (selectedMetrics.has('band_5_10')) {
-        point.band_5_10 = calculateFrequencyBandRMS(window, sampleRate, 5, 10)
-      }
-      if (selectedMetrics.has('band_10_20')) {
-        point.band_10_20 = calculateFrequencyBandRMS(window, sampleRate, 10, 20)
-      }
-      if (selectedMetrics.has('band_20_30')) {
-        point.band_20_30 = calculateFrequencyBandRMS(window, sampleRate, 20, 30)
-      }
-      if (selectedMetrics.has('band_30_40')) {
-        point.band_30_40 = calculateFrequencyBandRMS(window, sampleRate, 30, 40)
-      }
-      if (selectedMetrics.has('band_40_50')) {
-        point.band_40_50 = calculateFrequencyBandRMS(window, sampleRate, 40, 50)
-      }
-      if (selectedMetrics.has('band_50_60')) {
-        point.band_50_60 = calculateFrequencyBandRMS(window, sampleRate, 50, 60)
-      }
-      if (selectedMetrics.has('band_60_70')) {
-        point.band_60_70 = calculateFrequencyBandRMS(window, sampleRate, 60, 70)
-      }
-      if (selectedMetrics.has('band_70_80')) {
-        point.band_70_80 = calculateFrequencyBandRMS(window, sampleRate, 70, 80)
-      }
-      if (selectedMetrics.has('band_80_90')) {
-        point.band_80_90 = calculateFrequencyBandRMS(window, sampleRate, 80, 90)
-      }
-      if (selectedMetrics.has('band_90_100')) {
-        point.band_90_100 = calculateFrequencyBandRMS(window, sampleRate, 90, 100)
-      }
-      
-      results.push(point)
-    }
+    const results = calculateWindowMetrics(dataPoints, {
+      windowSizeSamples,
+      stepSize,
+      sampleRate,
+      startTime,
+      selectedMetrics,
+    })
     
     setMetricData(results)
     if (snapToNow) {
@@ -0,0 +1,96 @@
+import FFT from 'fft.js'
+import { FrequencyBand } from './types'
+
+export const FREQUENCY_BANDS: FrequencyBand[] = [
+  { metric: 'band_0_1', minFreq: 0, maxFreq: 1 },
+  { metric: 'band_1_5', minFreq: 1, maxFreq: 5 },
+  { metric: 'band_5_10', minFreq: 5, maxFreq: 10 },
+  { metric: 'band_10_20', minFreq: 10, maxFreq: 20 },
+  { metric: 'band_20_30', minFreq: 20, maxFreq: 30 },
+  { metric: 'band_30_40', minFreq: 30, maxFreq: 40 },
+  { metric: 'band_40_50', minFreq: 40, maxFreq: 50 },
+  { metric: 'band_50_60', minFreq: 50, maxFreq: 60 },
+  { metric: 'band_60_70', minFreq: 60, maxFreq: 70 },
+  { metric: 'band_70_80', minFreq: 70, maxFreq: 80 },
+  { metric: 'band_80_90', minFreq: 80, maxFreq: 90 },
+  { metric: 'band_90_100', minFreq: 90, maxFreq: 100 },
+]
+
+// FFT instances precompute their twiddle tables, so keep one per size along
+// with input and output buffers that every window of that size reuses
+const createFFTWorkspace = (size: number) => {
+  const fft = new FFT(size)
+  return {
+    fft,
+    input: new Float64Array(size),
+    output: fft.createComplexArray(),
+  }
+}
+
+type FFTWorkspace = ReturnType<typeof createFFTWorkspace>
+
+const fftWorkspaceCache = new Map<number, FFTWorkspace>()
+
+const getFFTWorkspace = (size: number): FFTWorkspace => {
+  let workspace = fftWorkspaceCache.get(size)
+  if (!workspace) {
+    workspace = createFFTWorkspace(size)
+    fftWorkspaceCache.set(size, workspace)
+  }
+  return workspace
+}
+
+// Bands are contiguous, so band j covers FFT bins [edges[j], edges[j + 1]).
+// Edges are keyed by FFT size and sample rate
+const bandEdgesCache = new Map<string, Int32Array>()
+
+const getBandEdges = (fftSize: number, sampleRate: number): Int32Array => {
+  const key = `${fftSize}:${sampleRate}`
+  const cached = bandEdgesCache.get(key)
+  if (cached) return cached
+
+  const freqResolution = sampleRate / fftSize
+  const binCount = fftSize / 2
+  const boundaries = [FREQUENCY_BANDS[0].minFreq, ...FREQUENCY_BANDS.map(band => band.maxFreq)]
+  const edges = new Int32Array(boundaries.length)
+  let bin = 0
+  for (let j = 0; j < boundaries.length; j++) {
+    while (bin < binCount && bin * freqResolution < boundaries[j]) bin++
+    edges[j] = bin
+  }
+  bandEdgesCache.set(key, edges)
+  return edges
+}
+
+// Calculate RMS in every frequency band from a single FFT of the window
+export const calculateFrequencyBandsRMS = (magnitudes: Float64Array, length: number, sampleRate: number): number[] => {
+  if (length === 0 || sampleRate === 0) return FREQUENCY_BANDS.map(() => 0)
+
+  // Pad to next power of 2 for FFT
+  const fftSize = Math.pow(2, Math.ceil(Math.log2(length)))
+  const { fft, input, output: out } = getFFTWorkspace(fftSize)
+
+  // Pad signal with zeros
+  input.set(magnitudes.subarray(0, length))
+  input.fill(0, length)
+
+  // Compute FFT
+  fft.realTransform(out, input)
+
+  // Sum power between consecutive band edges, one sweep over the spectrum
+  const edges = getBandEdges(fftSize, sampleRate)
+  const bandRMS = new Array<number>(FREQUENCY_BANDS.length)
+  for (let j = 0; j < FREQUENCY_BANDS.length; j++) {
+    let sumPower = 0
+    for (let i = edges[j]; i < edges[j + 1]; i++) {
+      const real = out[2 * i]
+      const imag = out[2 * i + 1]
+      sumPower += real * real + imag * imag
+    }
+
+    // RMS in the band
+    const count = edges[j + 1] - edges[j]
+    bandRMS[j] = count > 0 ? Math.sqrt(sumPower / count) : 0
+  }
+  return bandRMS
+}
@@ -0,0 +1,3 @@
+export { calculateWindowMetrics } from './windowMetrics'
+export { FREQUENCY_BANDS, calculateFrequencyBandsRMS } from './frequencyBands'
+export * from './types'
@@ -0,0 +1,42 @@
+// Common types for windowed acceleration metrics
+
+export interface MetricDataPoint {
+  time: number
+  absoluteTime: Date
+  rms_x?: number
+  rms_y?: number
+  rms_z?: number
+  rms_total?: number
+  percentile_90?: number
+  band_0_1?: number
+  band_1_5?: number
+  band_5_10?: number
+  band_10_20?: number
+  band_20_30?: number
+  band_30_40?: number
+  band_40_50?: number
+  band_50_60?: number
+  band_60_70?: number
+  band_70_80?: number
+  band_80_90?: number
+  band_90_100?: number
+}
+
+export type MetricType = 'rms_x' | 'rms_y' | 'rms_z' | 'rms_total' | 'percentile_90' | 
+  'band_0_1' | 'band_1_5' | 'band_5_10' | 'band_10_20' | 'band_20_30' | 
+  'band_30_40' | 'band_40_50' | 'band_50_60' | 'band_60_70' | 'band_70_80' | 
+  'band_80_90' | 'band_90_100'
+
+export interface FrequencyBand {
+  metric: MetricType
+  minFreq: number
+  maxFreq: number
+}
+
+export interface WindowMetricsOptions {
+  windowSizeSamples: number
+  stepSize: number
+  sampleRate: number
+  startTime: Date
+  selectedMetrics: Set<MetricType>
+}
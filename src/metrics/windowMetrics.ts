@@ -0,0 +1,190 @@
+import { DataPoint } from '../parsers'
+import { MetricDataPoint, MetricType, WindowMetricsOptions } from './types'
+import { FREQUENCY_BANDS, calculateFrequencyBandsRMS } from './frequencyBands'
+
+interface AxisArrays {
+  x: Float64Array
+  y: Float64Array
+  z: Float64Array
+}
+
+interface AxisSumSquares {
+  x: number
+  y: number
+  z: number
+}
+
+interface SampleStats {
+  axes: AxisArrays
+  magnitudes: Float64Array
+}
+
+// Split samples into one contiguous array per axis
+const toAxisArrays = (dataPoints: DataPoint[]): AxisArrays => {
+  const n = dataPoints.length
+  const axes: AxisArrays = {
+    x: new Float64Array(n),
+    y: new Float64Array(n),
+    z: new Float64Array(n),
+  }
+  for (let i = 0; i < n; i++) {
+    const point = dataPoints[i]
+    axes.x[i] = point.ax
+    axes.y[i] = point.ay
+    axes.z[i] = point.az
+  }
+  return axes
+}
+
+// Keep the axes and the magnitude of each sample, so overlapping windows
+// share the magnitudes instead of recomputing them
+const calculateSampleStats = (axes: AxisArrays): SampleStats => {
+  const { x, y, z } = axes
+  const n = x.length
+  const magnitudes = new Float64Array(n)
+  for (let i = 0; i < n; i++) {
+    magnitudes[i] = Math.sqrt(x[i] * x[i] + y[i] * y[i] + z[i] * z[i])
+  }
+  return { axes, magnitudes }
+}
+
+// Per-axis sums of squares over samples [start, end), in a single pass
+const calculateAxisSumSquares = (stats: SampleStats, start: number, end: number): AxisSumSquares => {
+  const { x, y, z } = stats.axes
+  let sumX = 0
+  let sumY = 0
+  let sumZ = 0
+  for (let i = start; i < end; i++) {
+    sumX += x[i] * x[i]
+    sumY += y[i] * y[i]
+    sumZ += z[i] * z[i]
+  }
+  return { x: sumX, y: sumY, z: sumZ }
+}
+
+// Find the k-th smallest of the first length values without a full sort
+// (quickselect, reorders the values in place)
+const selectKth = (values: Float64Array, length: number, k: number): number => {
+  let left = 0
+  let right = length - 1
+  while (left < right) {
+    const pivot = values[k]
+    let i = left
+    let j = right
+    do {
+      while (values[i] < pivot) i++
+      while (pivot < values[j]) j--
+      if (i <= j) {
+        const tmp = values[i]
+        values[i] = values[j]
+        values[j] = tmp
+        i++
+        j--
+      }
+    } while (i <= j)
+    if (j < k) left = i
+    if (k < i) right = j
+  }
+  return values[k]
+}
+
+// Calculate 90th percentile (reorders the magnitudes in place)
+const calculate90thPercentile = (magnitudes: Float64Array, length: number): number => {
+  const index = Math.floor(length * 0.9)
+  return selectKth(magnitudes, length, index)
+}
+
+// Per-sample stats only depend on the data, so repeated runs over the same
+// data (new window size, overlap or metric selection) reuse them
+const sampleStatsCache = new WeakMap<DataPoint[], SampleStats>()
+
+const getSampleStats = (dataPoints: DataPoint[]): SampleStats => {
+  let stats = sampleStatsCache.get(dataPoints)
+  if (!stats) {
+    stats = calculateSampleStats(toAxisArrays(dataPoints))
+    sampleStatsCache.set(dataPoints, stats)
+  }
+  return stats
+}
+
+// Calculate the selected metrics for every window of windowSizeSamples,
+// advancing stepSize samples at a time
+export function calculateWindowMetrics(dataPoints: DataPoint[], options: WindowMetricsOptions): MetricDataPoint[] {
+  const { windowSizeSamples, stepSize, sampleRate, startTime, selectedMetrics } = options
+  if (dataPoints.length === 0 || sampleRate === 0) return []
+
+  // Resolve the selected bands once rather than per window. Bands starting
+  // at or above Nyquist have no FFT bins, so their RMS is always 0
+  const nyquist = sampleRate / 2
+  const selectedBands = FREQUENCY_BANDS
+    .map((band, index) => ({ ...band, index }))
+    .filter(({ metric }) => selectedMetrics.has(metric))
+  const validBands = selectedBands.filter(band => band.minFreq < nyquist)
+  const emptyBands = selectedBands.filter(band => band.minFreq >= nyquist)
+  const hasRMSMetric = (['rms_x', 'rms_y', 'rms_z', 'rms_total'] as MetricType[])
+    .some(metric => selectedMetrics.has(metric))
+  const needsMagnitudes = validBands.length > 0 || selectedMetrics.has('percentile_90')
+  const results: MetricDataPoint[] = []
+
+  const stats = getSampleStats(dataPoints)
+  const magnitudes = new Float64Array(windowSizeSamples)
+
+  // Process data in overlapping windows of [i, windowEnd)
+  for (let i = 0; i < dataPoints.length; i += stepSize) {
+    const windowEnd = Math.min(i + windowSizeSamples, dataPoints.length)
+    const windowLength = windowEnd - i
+
+    if (windowLength === 0) break
+
+    // Use the maximum timestamp in the window
+    const maxTimeInWindow = dataPoints[windowEnd - 1].time
+    const absoluteTime = new Date(startTime.getTime() + maxTimeInWindow * 1000)
+
+    const point: MetricDataPoint = {
+      time: maxTimeInWindow,
+      absoluteTime,
+    }
+
+    // Calculate all metrics
+    if (hasRMSMetric) {
+      // Total RMS follows from the axis sums, since |a|² = ax² + ay² + az²
+      const sumSquares = calculateAxisSumSquares(stats, i, windowEnd)
+      if (selectedMetrics.has('rms_x')) {
+        point.rms_x = Math.sqrt(sumSquares.x / windowLength)
+      }
+      if (selectedMetrics.has('rms_y')) {
+        point.rms_y = Math.sqrt(sumSquares.y / windowLength)
+      }
+      if (selectedMetrics.has('rms_z')) {
+        point.rms_z = Math.sqrt(sumSquares.z / windowLength)
+      }
+      if (selectedMetrics.has('rms_total')) {
+        point.rms_total = Math.sqrt((sumSquares.x + sumSquares.y + sumSquares.z) / windowLength)
+      }
+    }
+
+    if (needsMagnitudes) {
+      magnitudes.set(stats.magnitudes.subarray(i, windowEnd))
+    }
+
+    // Frequency bands
+    if (validBands.length > 0) {
+      const bandRMS = calculateFrequencyBandsRMS(magnitudes, windowLength, sampleRate)
+      for (const { metric, index } of validBands) {
+        point[metric] = bandRMS[index]
+      }
+    }
+    for (const { metric } of emptyBands) {
+      point[metric] = 0
+    }
+
+    // Reorders the magnitudes, so it must run after the FFT
+    if (selectedMetrics.has('percentile_90')) {
+      point.percentile_90 = calculate90thPercentile(magnitudes, windowLength)
+    }
+
+    results.push(point)
+  }
+  
+  return results
+}